@@ -23,7 +23,6 @@ import numpy as np
 import os
 import pyqtgraph as pg
 
-from collections import OrderedDict
 from qudi.core.connector import Connector
 from qudi.util.colordefs import QudiPalettePale as palette
 from qudi.core.module import GuiBase
@@ -22,7 +22,6 @@ If not, see <https://www.gnu.org/licenses/>.
 __all__ = ('TiltCorrectionDockWidget')
 
 import numpy as np
-from collections import OrderedDict
 
 from PySide2 import QtCore, QtGui, QtWidgets
 from PySide2.QtWidgets import QDockWidget, QWidget,QGridLayout, QLabel, QPushButton,QTableWidget
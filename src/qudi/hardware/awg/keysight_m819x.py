@@ -20,7 +20,6 @@ You should have received a copy of the GNU Lesser General Public License along w
 If not, see <https://www.gnu.org/licenses/>.
 """
 
-import re
 try:
     import pyvisa as visa
 except ImportError:
@@ -30,7 +29,6 @@ import time
 import numpy as np
 import scipy.interpolate
 from fnmatch import fnmatch
-from collections import OrderedDict
 from abc import abstractmethod
 
 from qudi.core.configoption import ConfigOption
@@ -67,6 +65,11 @@ class AWGM819X(PulserInterface):
     # explicitly set low/high levels for [[d_ch1_low, d_ch1_high], [d_ch2_low, d_ch2_high], ...]
     _d_ch_level_low_high = ConfigOption(name='d_ch_level_low_high', default=[], missing='nothing')
 
+    # (continuous, gate) initiate states for each trigger mode
+    _trigger_mode_states = {'cont': ('ON', 'OFF'), 'trig': ('OFF', 'OFF'), 'gate': ('OFF', 'ON')}
+    # arm trigger slope for each trigger polarity
+    _trigger_polarity_slopes = {'pos': 'POS', 'neg': 'NEG', 'both': 'EITH'}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -1262,11 +1265,11 @@ class AWGM819X(PulserInterface):
             has_ch_ext = True
 
             for waveform in load_dict:
-                pattern = ".*_ch[0-9]+?"
-                has_ch_ext = True if re.match(pattern, waveform) is not None else False
+                # strip a possible .bin/.bin8 file extension (pc_hdd memory mode) before parsing
+                _, ch_ext, channel = waveform.split('.bin', 1)[0].rpartition('_ch')
+                has_ch_ext = bool(ch_ext) and channel.isdecimal()
                 if has_ch_ext:
-                    channel = int(waveform.rsplit('_ch', 1)[1][0])
-                    new_dict[channel] = waveform
+                    new_dict[int(channel)] = waveform
                 else:
                     break
             if not has_ch_ext:
@@ -1336,17 +1339,13 @@ class AWGM819X(PulserInterface):
         :param mode: "cont", "trig" or "gate"
         :return:
         """
-        if mode is "cont":
-            self.write_all_ch(":INIT:CONT{}:STAT ON",  all_by_one={'m8195a': True})
-            self.write_all_ch(":INIT:GATE{}:STAT OFF", all_by_one={'m8195a': True})
-        elif mode is "trig":
-            self.write_all_ch(":INIT:CONT{}:STAT OFF", all_by_one={'m8195a': True})
-            self.write_all_ch(":INIT:GATE{}:STAT OFF", all_by_one={'m8195a': True})
-        elif mode is "gate":
-            self.write_all_ch(":INIT:CONT{}:STAT OFF", all_by_one={'m8195a': True})
-            self.write_all_ch(":INIT:GATE{}:STAT ON",  all_by_one={'m8195a': True})
-        else:
+        states = self._trigger_mode_states.get(mode)
+        if states is None:
             self.log.error("Unknown trigger mode: {}".format(mode))
+            return
+        cont_state, gate_state = states
+        self.write_all_ch(":INIT:CONT{}:STAT " + cont_state, all_by_one={'m8195a': True})
+        self.write_all_ch(":INIT:GATE{}:STAT " + gate_state, all_by_one={'m8195a': True})
 
     def get_trigger_mode(self):
         cont = bool(int(self.query_all_ch(":INIT:CONT{}:STAT?", all_by_one={'m8195a': True})))
@@ -2020,15 +2019,11 @@ class AWGM819X(PulserInterface):
         return state, seq_table_id
 
     def set_trig_polarity(self, pol='pos'):
-        if pol is "pos":
-            self.write(":ARM:TRIG:SLOP POS")
-        elif pol is "neg":
-            self.write(":ARM:TRIG:SLOP NEG")
-        elif pol is "both":
-            self.write(":ARM:TRIG:SLOP EITH")
-
-        else:
+        slope = self._trigger_polarity_slopes.get(pol)
+        if slope is None:
             self.log.error("Unknown trigger polarity: {}".format(pol))
+            return
+        self.write(":ARM:TRIG:SLOP " + slope)
 
     def _remove_file_extension(self, filename):
         """
@@ -2241,7 +2236,7 @@ class AWGM8195A(AWGM819X):
         # UNAMBIGUOUSLY the channels. Here all possible channel configurations
         # are stated, where only the generic names should be used. The names
         # for the different configurations can be customary chosen.
-        activation_config = OrderedDict()
+        activation_config = dict()
         if self._MODEL == 'M8195A':
             awg_mode = self.awg_mode
             if awg_mode == 'MARK':
@@ -2619,7 +2614,7 @@ class AWGM8190A(AWGM819X):
         # are stated, where only the generic names should be used. The names
         # for the different configurations can be customary chosen.
 
-        activation_config = OrderedDict()
+        activation_config = dict()
 
         if self._MODEL == 'M8190A':
             # all allowed configs
@@ -25,8 +25,7 @@ import os
 import time
 from ftplib import FTP
 from fnmatch import fnmatch
-from collections import OrderedDict
-from socket import socket, AF_INET, SOCK_STREAM
+from socket import socket, AF_INET, SOCK_STREAM, IPPROTO_TCP, TCP_NODELAY
 
 from qudi.util.paths import get_appdata_dir
 from qudi.core.configoption import ConfigOption
@@ -64,6 +63,13 @@ class AWG5002C(PulserInterface):
     passwd = ConfigOption('ftp_passwd', 'anonymous@', missing='warn')
     default_sample_rate = ConfigOption('default_sample_rate', missing='warn')
 
+    # run mode command for each output mode abbreviation accepted by set_mode
+    _run_mode_commands = {'C': 'AWGC:RMOD CONT',
+                          'T': 'AWGC:RMOD TRIG',
+                          'G': 'AWGC:RMOD GAT',
+                          'E': 'AWGC:RMOD ENH',
+                          'S': 'AWGC:RMOD SEQ'}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -81,6 +87,9 @@ class AWG5002C(PulserInterface):
         # stream socket.
         self.soc = socket(AF_INET, SOCK_STREAM)
         self.soc.settimeout(self._timeout)  # set the timeout if no answer comes
+        # disable Nagle's algorithm, otherwise short commands are delayed until the previous
+        # packet has been acknowledged
+        self.soc.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
 
         # Use connect and not the bind method. Bind is always performed by the
         # server where connect is done by the client!
@@ -238,7 +247,7 @@ class AWG5002C(PulserInterface):
         # the name a_ch<num> and d_ch<num> are generic names, which describe UNAMBIGUOUSLY the
         # channels. Here all possible channel configurations are stated, where only the generic
         # names should be used. The names for the different configurations can be customary chosen.
-        activation_config = OrderedDict()
+        activation_config = dict()
         activation_config['config1'] = frozenset(
             {'a_ch1', 'd_ch1', 'd_ch2', 'a_ch2', 'd_ch3', 'd_ch4'})
         activation_config['config2'] = frozenset({'a_ch1', 'd_ch1', 'd_ch2'})
@@ -362,6 +371,8 @@ class AWG5002C(PulserInterface):
         # Find all files associated with the specified asset name
         file_list = self._get_filenames_on_device()
         filename = []
+        # collect all load commands and send them to the device in a single write
+        commands = list()
 
         # Be careful which asset_name to specify as the current_loaded_asset
         # because a loaded sequence contains also individual waveforms, which
@@ -370,16 +381,16 @@ class AWG5002C(PulserInterface):
         if (asset_name + '.seq') in file_list:
             file_name = asset_name + '.seq'
 
-            self.tell('SOUR1:FUNC:USER "{0}/{1}"\n'.format(path, file_name))
+            commands.append('SOUR1:FUNC:USER "{0}/{1}"\n'.format(path, file_name))
             # set the AWG to the event jump mode:
-            self.tell('AWGCONTROL:EVENT:JMODE EJUMP')
+            commands.append('AWGCONTROL:EVENT:JMODE EJUMP\n')
 
             self.current_loaded_asset = asset_name
         else:
 
             for file in file_list:
                 if file == asset_name+'_ch1.wfm':
-                    self.tell('SOUR1:FUNC:USER "{0}/{1}"\n'.format(path, asset_name+'_ch1.wfm'))
+                    commands.append('SOUR1:FUNC:USER "{0}/{1}"\n'.format(path, asset_name+'_ch1.wfm'))
                     # if the asset is not a sequence file, then it must be a wfm
                     # file and either both or one of the channels should contain
                     # the asset name:
@@ -387,7 +398,7 @@ class AWG5002C(PulserInterface):
 
                     filename.append(file)
                 elif file == asset_name+'_ch2.wfm':
-                    self.tell('SOUR2:FUNC:USER "{0}/{1}"\n'.format(path, asset_name+'_ch2.wfm'))
+                    commands.append('SOUR2:FUNC:USER "{0}/{1}"\n'.format(path, asset_name+'_ch2.wfm'))
                     filename.append(file)
                     # if the asset is not a sequence file, then it must be a wfm
                     # file and either both or one of the channels should contain
@@ -400,7 +411,10 @@ class AWG5002C(PulserInterface):
 
         for channel_num in list(load_dict):
             file_name = str(load_dict[channel_num]) + '_ch{0}.wfm'.format(int(channel_num))
-            self.tell('SOUR{0}:FUNC:USER "{1}/{2}"\n'.format(channel_num, path, file_name))
+            commands.append('SOUR{0}:FUNC:USER "{1}/{2}"\n'.format(channel_num, path, file_name))
+
+        if commands:
+            self.tell(''.join(commands))
 
         if len(load_dict) > 0:
             self.current_loaded_asset = asset_name
@@ -875,6 +889,8 @@ class AWG5002C(PulserInterface):
         if ch is None:
             ch = {}
 
+        # collect all output state commands and send them to the device in one go
+        commands = list()
         for channel in ch:
             if 'a_ch' in channel:
                 ana_chan = int(channel[4:])
@@ -883,13 +899,15 @@ class AWG5002C(PulserInterface):
                         state = 'ON'
                     else:
                         state = 'OFF'
-                    self.tell('OUTPUT{0}:STATE {1}'.format(ana_chan, state))
+                    commands.append('OUTPUT{0}:STATE {1}\n'.format(ana_chan, state))
 
                 else:
                     self.log.warning('The device does not support that many analog channels! A '
                                      'channel number "{0}" was passed, but only "{1}" channels are '
                                      'available!\nCommand will be ignored.'
                                      ''.format(ana_chan, self._get_num_a_ch()))
+        if commands:
+            self.tell(''.join(commands))
 
         # if d_ch != {}:
         #     self.log.info('Digital Channel of the AWG5000 series will always be '
@@ -1057,7 +1075,7 @@ class AWG5002C(PulserInterface):
         # In Python 3.x the socket send command only accepts byte type arrays
         # and no str
         command = bytes(command, 'UTF-8')
-        self.soc.send(command)
+        self.soc.sendall(command)
         return 0
 
     def ask(self, question):
@@ -1073,11 +1091,9 @@ class AWG5002C(PulserInterface):
         # In Python 3.x the socket send command only accepts byte type arrays
         #  and no str.
         question = bytes(question, 'UTF-8')
-        self.soc.send(question)
-        time.sleep(0.3)  # you need to wait until AWG generating an answer.
-                         # This number was determined experimentally.
+        self.soc.sendall(question)
         try:
-            message = self.soc.recv(self.input_buffer)  # receive an answer
+            message = self._recv_line()  # receive an answer
             message = message.decode('UTF-8')   # decode bytes into a python str
         except OSError:
             self.log.error('Most propably timeout was reached during querying the AWG5000 Series '
@@ -1090,6 +1106,22 @@ class AWG5002C(PulserInterface):
 
         return message
 
+    def _recv_line(self):
+        """ Receive from the socket until the answer is terminated by a newline character.
+
+        Instead of waiting a fixed time for the AWG to generate an answer, return as soon as the
+        complete answer has arrived. The socket timeout still applies to every single recv call.
+
+        @return bytes: the raw answer of the device including the termination character
+        """
+        buffer = bytearray()
+        while not buffer.endswith(b'\n'):
+            chunk = self.soc.recv(self.input_buffer)
+            if not chunk:
+                break
+            buffer.extend(chunk)
+        return bytes(buffer)
+
     def reset(self):
         """Reset the device.
 
@@ -1151,13 +1183,7 @@ class AWG5002C(PulserInterface):
                             sequence   - 'S'
 
         """
-
-        look_up = {'C': 'CONT',
-                   'T': 'TRIG',
-                   'G': 'GAT',
-                   'E': 'ENH',
-                   'S': 'SEQ'}
-        self.tell('AWGC:RMOD {0!s}\n'.format(look_up[mode.upper()]))
+        self.tell(self._run_mode_commands[mode.upper()] + '\n')
 
     def get_sequencer_mode(self, output_as_int=False):
         """ Asks the AWG which sequencer mode it is using.
@@ -1201,11 +1227,9 @@ class AWG5002C(PulserInterface):
         @return: str, absolute path to the directory with folder 'name'.
         """
 
-        path = os.path.join(self._tmp_work_dir, name)
-        if not os.path.exists(path):
-            os.makedirs(os.path.abspath(path))
-
-        return os.path.abspath(path)
+        path = os.path.abspath(os.path.join(self._tmp_work_dir, name))
+        os.makedirs(path, exist_ok=True)
+        return path
 
     def _get_filenames_on_device(self):
         """ Get the full filenames of all assets saved on the device.
@@ -28,7 +28,7 @@ try:
 except ImportError:
     import visa
 import numpy as np
-from ftplib import FTP
+from ftplib import FTP, error_perm
 from lxml import etree as ET
 
 from qudi.core.configoption import ConfigOption
@@ -80,6 +80,7 @@ class AWG70K(PulserInterface):
         self.awg_model = ''  # String describing the model
 
         self.ftp_working_dir = 'waves'  # subfolder of FTP root dir on AWG disk to work in
+        self._awg_working_dir = ''  # full path of the FTP working dir on the AWG disk
 
         self.__max_seq_steps = 0
         self.__max_seq_repetitions = 0
@@ -92,8 +93,9 @@ class AWG70K(PulserInterface):
         """ Initialisation performed during activation of the module.
         """
         # Create work directory if necessary
-        if not os.path.exists(self._tmp_work_dir):
-            os.makedirs(os.path.abspath(self._tmp_work_dir))
+        os.makedirs(os.path.abspath(self._tmp_work_dir), exist_ok=True)
+        # Compose the AWG side working dir once instead of for every waveform file to load
+        self._awg_working_dir = os.path.join(self._ftp_dir, self.ftp_working_dir)
 
         # connect to awg using PyVISA
         if self._visa_address not in self._rm.list_resources():
@@ -409,8 +411,8 @@ class AWG70K(PulserInterface):
             self.log.debug('Send WFMX file: {0}'.format(time.time() - start))
 
             start = time.time()
-            self.write('MMEM:OPEN "{0}"'.format(os.path.join(
-                self._ftp_dir, self.ftp_working_dir, wfm_name + '.wfmx')))
+            self.write('MMEM:OPEN "{0}"'.format(
+                os.path.join(self._awg_working_dir, wfm_name + '.wfmx')))
             # Wait for everything to complete
             timeout_old = self.awg.timeout
             # increase this time so that there is no timeout for loading longer sequences
@@ -877,43 +879,44 @@ class AWG70K(PulserInterface):
 
         # amplitude sanity check
         if amplitude is not None:
-            for chnl in amplitude:
-                ch_num = int(chnl.rsplit('_ch', 1)[1])
+            checked_amplitude = dict()
+            for chnl, amp in amplitude.items():
                 if chnl not in analog_channels:
-                    self.log.warning('Channel to set (a_ch{0}) not available in AWG.\nSetting '
+                    self.log.warning('Channel to set ({0}) not available in AWG.\nSetting '
                                      'analogue voltage for this channel ignored.'.format(chnl))
-                    del amplitude[chnl]
-                if amplitude[chnl] < constraints.a_ch_amplitude.min:
+                    continue
+                if amp < constraints.a_ch_amplitude.min:
                     self.log.warning('Minimum Vpp for channel "{0}" is {1}. Requested Vpp of {2}V '
                                      'was ignored and instead set to min value.'
-                                     ''.format(chnl, constraints.a_ch_amplitude.min,
-                                               amplitude[chnl]))
-                    amplitude[chnl] = constraints.a_ch_amplitude.min
-                elif amplitude[chnl] > constraints.a_ch_amplitude.max:
+                                     ''.format(chnl, constraints.a_ch_amplitude.min, amp))
+                    amp = constraints.a_ch_amplitude.min
+                elif amp > constraints.a_ch_amplitude.max:
                     self.log.warning('Maximum Vpp for channel "{0}" is {1}. Requested Vpp of {2}V '
                                      'was ignored and instead set to max value.'
-                                     ''.format(chnl, constraints.a_ch_amplitude.max,
-                                               amplitude[chnl]))
-                    amplitude[chnl] = constraints.a_ch_amplitude.max
+                                     ''.format(chnl, constraints.a_ch_amplitude.max, amp))
+                    amp = constraints.a_ch_amplitude.max
+                checked_amplitude[chnl] = amp
+            amplitude = checked_amplitude
         # offset sanity check
         if offset is not None:
-            for chnl in offset:
-                ch_num = int(chnl.rsplit('_ch', 1)[1])
+            checked_offset = dict()
+            for chnl, off in offset.items():
                 if chnl not in analog_channels:
-                    self.log.warning('Channel to set (a_ch{0}) not available in AWG.\nSetting '
+                    self.log.warning('Channel to set ({0}) not available in AWG.\nSetting '
                                      'offset voltage for this channel ignored.'.format(chnl))
-                    del offset[chnl]
-                if offset[chnl] < constraints.a_ch_offset.min:
+                    continue
+                if off < constraints.a_ch_offset.min:
                     self.log.warning('Minimum offset for channel "{0}" is {1}. Requested offset of '
                                      '{2}V was ignored and instead set to min value.'
-                                     ''.format(chnl, constraints.a_ch_offset.min, offset[chnl]))
-                    offset[chnl] = constraints.a_ch_offset.min
-                elif offset[chnl] > constraints.a_ch_offset.max:
+                                     ''.format(chnl, constraints.a_ch_offset.min, off))
+                    off = constraints.a_ch_offset.min
+                elif off > constraints.a_ch_offset.max:
                     self.log.warning('Maximum offset for channel "{0}" is {1}. Requested offset of '
                                      '{2}V was ignored and instead set to max value.'
-                                     ''.format(chnl, constraints.a_ch_offset.max,
-                                               offset[chnl]))
-                    offset[chnl] = constraints.a_ch_offset.max
+                                     ''.format(chnl, constraints.a_ch_offset.max, off))
+                    off = constraints.a_ch_offset.max
+                checked_offset[chnl] = off
+            offset = checked_offset
 
         if amplitude is not None:
             for chnl, amp in amplitude.items():
@@ -1535,18 +1538,6 @@ class AWG70K(PulserInterface):
                     filename_list.append(filename)
         return filename_list
 
-    def _delete_file(self, filename):
-        """
-
-        @param str filename:
-        """
-        if filename in self._get_filenames_on_device():
-            with FTP(self._ip_address) as ftp:
-                ftp.login(user=self._username, passwd=self._password)
-                ftp.cwd(self.ftp_working_dir)
-                ftp.delete(filename)
-        return
-
     def _send_file(self, filename):
         """
 
@@ -1564,13 +1555,15 @@ class AWG70K(PulserInterface):
                            ''.format(filename, self._tmp_work_dir))
             return -1
 
-        # Delete old file on AWG by the same filename
-        self._delete_file(filename)
-
-        # Transfer file
+        # Delete old file on AWG by the same filename and transfer the new one within a single
+        # FTP session. Deleting a file that does not exist raises error_perm, which is fine here.
         with FTP(self._ip_address) as ftp:
             ftp.login(user=self._username, passwd=self._password)
             ftp.cwd(self.ftp_working_dir)
+            try:
+                ftp.delete(filename)
+            except error_perm:
+                pass
             with open(filepath, 'rb') as file:
                 ftp.storbinary('STOR ' + filename, file)
         return 0
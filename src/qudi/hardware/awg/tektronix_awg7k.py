@@ -28,7 +28,7 @@ try:
 except ImportError:
     import visa
 import numpy as np
-from ftplib import FTP
+from ftplib import FTP, error_perm
 
 from qudi.util.paths import get_appdata_dir
 from qudi.util.helpers import natural_sort
@@ -66,6 +66,13 @@ class AWG7k(PulserInterface):
     _password = ConfigOption(name='ftp_passwd', default='anonymous@', missing='warn')
     _visa_timeout = ConfigOption(name='timeout', default=30, missing='nothing')
 
+    # run mode command for each output mode abbreviation accepted by set_mode
+    _run_mode_commands = {'C': 'AWGC:RMOD CONT',
+                          'T': 'AWGC:RMOD TRIG',
+                          'G': 'AWGC:RMOD GAT',
+                          'E': 'AWGC:RMOD ENH',
+                          'S': 'AWGC:RMOD SEQ'}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -90,8 +97,7 @@ class AWG7k(PulserInterface):
         """ Initialisation performed during activation of the module.
         """
         # Create work directory if necessary
-        if not os.path.exists(self._tmp_work_dir):
-            os.makedirs(os.path.abspath(self._tmp_work_dir))
+        os.makedirs(os.path.abspath(self._tmp_work_dir), exist_ok=True)
 
         try:
             self.awg = self._rm.open_resource(
@@ -1236,12 +1242,7 @@ class AWG7k(PulserInterface):
                             sequence   - 'S'
 
         """
-        look_up = {'C': 'CONT',
-                   'T': 'TRIG',
-                   'G': 'GAT',
-                   'E': 'ENH',
-                   'S': 'SEQ'}
-        self.write('AWGC:RMOD {0!s}'.format(look_up[mode.upper()]))
+        self.write(self._run_mode_commands[mode.upper()])
 
     # works
     def get_sequencer_mode(self, output_as_int=False):
@@ -1265,18 +1266,6 @@ class AWG7k(PulserInterface):
                 return 1 if output_as_int else 'Software-Sequencer'
         return -1 if output_as_int else 'Request-Error'
 
-    def _delete_file(self, filename):
-        """
-
-        @param str filename: The full filename to delete from FTP cwd
-        """
-        if filename in self._get_filenames_on_device():
-            with FTP(self._ip_address) as ftp:
-                ftp.login(user=self._username, passwd=self._password)
-                ftp.cwd(self.ftp_working_dir)
-                ftp.delete(filename)
-        return
-
     def _send_file(self, filename):
         """
 
@@ -1294,13 +1283,15 @@ class AWG7k(PulserInterface):
                            ''.format(filename, self._tmp_work_dir))
             return -1
 
-        # Delete old file on AWG by the same filename
-        self._delete_file(filename)
-
-        # Transfer file
+        # Delete old file on AWG by the same filename and transfer the new one within a single
+        # FTP session. Deleting a file that does not exist raises error_perm, which is fine here.
         with FTP(self._ip_address) as ftp:
             ftp.login(user=self._username, passwd=self._password)
             ftp.cwd(self.ftp_working_dir)
+            try:
+                ftp.delete(filename)
+            except error_perm:
+                pass
             with open(filepath, 'rb') as file:
                 ftp.storbinary('STOR ' + filename, file)
         return 0
@@ -30,7 +30,6 @@ import PyDAQmx as daq
 from qudi.core.module import Base
 from qudi.core.configoption import ConfigOption
 from qudi.interface.pulser_interface import PulserInterface
-from collections import OrderedDict
 
 
 class NationalInstrumentsPulser(Base, PulserInterface):
@@ -104,7 +103,7 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         """
         device = self.device
         constraints = {}
-        ch_map = OrderedDict()
+        ch_map = dict()
 
         n = 2048
         ao_max_freq = daq.float64()
@@ -221,10 +220,10 @@ class NationalInstrumentsPulser(Base, PulserInterface):
 
         # If sequencer mode is enable than sequence_param should be not just an
         # empty dictionary.
-        sequence_param = OrderedDict()
+        sequence_param = dict()
         constraints['sequence_param'] = sequence_param
 
-        activation_config = OrderedDict()
+        activation_config = dict()
         activation_config['analog_only'] = [k for k in ch_map.keys() if k.startswith('a')]
         activation_config['digital_only'] = [k for k in ch_map.keys() if k.startswith('d')]
         activation_config['stuff'] = ['a_ch4', 'd_ch1', 'd_ch2', 'd_ch3', 'd_ch4']
@@ -783,10 +782,9 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         @param name: string, name of the folder
         @return: string, absolute path to the directory with folder 'name'.
         """
-        path = os.path.join(self.pulsed_file_dir, name)
-        if not os.path.exists(path):
-            os.makedirs(os.path.abspath(path))
-        return os.path.abspath(path)
+        path = os.path.abspath(os.path.join(self.pulsed_file_dir, name))
+        os.makedirs(path, exist_ok=True)
+        return path
 
     def _get_filenames_on_host(self):
         """ Get the full filenames of all assets saved on the host PC.
@@ -54,6 +54,10 @@ class FastCounterDummy(FastCounterInterface):
                                                            'FastComTec_demo_timetrace.asc'))
             self.log.debug(f"Loading dummy fastcounter trace: {self.trace_path}")
 
+        # parsed trace file cached together with its (path, mtime, size) signature
+        self._trace_cache_key = None
+        self._trace_cache = None
+
     def on_activate(self):
         """ Initialisation performed during activation of the module.
         """
@@ -149,7 +153,7 @@ class FastCounterDummy(FastCounterInterface):
         time.sleep(1)
         self.statusvar = 2
         try:
-            self._count_data = np.loadtxt(self.trace_path, dtype='int64')
+            self._count_data = self._load_trace().copy()
         except:
             return -1
 
@@ -157,6 +161,17 @@ class FastCounterDummy(FastCounterInterface):
             self._count_data = self._count_data.transpose()
         return 0
 
+    def _load_trace(self):
+        """ Returns the parsed trace file. The file is only parsed again if it has changed on disk
+        since the last call.
+        """
+        stat = os.stat(self.trace_path)
+        cache_key = (self.trace_path, stat.st_mtime_ns, stat.st_size)
+        if cache_key != self._trace_cache_key:
+            self._trace_cache = np.loadtxt(self.trace_path, dtype='int64')
+            self._trace_cache_key = cache_key
+        return self._trace_cache
+
     def pause_measure(self):
         """ Pauses the current measurement.
 
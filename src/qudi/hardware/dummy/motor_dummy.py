@@ -20,7 +20,6 @@ You should have received a copy of the GNU Lesser General Public License along w
 If not, see <https://www.gnu.org/licenses/>.
 """
 
-from collections import OrderedDict
 import time
 
 from qudi.core.module import Base
@@ -105,7 +104,7 @@ class MotorDummy(Base, MotorInterface):
         insert just None. If you are not sure about the meaning, look in other
         hardware files to get an impression.
         """
-        constraints = OrderedDict()
+        constraints = dict()
 
         axis0 = {'label': self._x_axis.label,
                  'unit': 'm',
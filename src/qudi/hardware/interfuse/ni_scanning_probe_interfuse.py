@@ -23,6 +23,7 @@ If not, see <https://www.gnu.org/licenses/>.
 
 import numpy as np
 import time
+import logging
 from typing import Optional, Dict, List
 from dataclasses import asdict
 
@@ -346,8 +347,11 @@ class NiScanningProbeInterfuseBare(ScanningProbeInterface):
     def __wait_on_move_done(self):
         try:
             t_start = time.perf_counter()
+            # Skip building the debug message on every poll unless it will actually be emitted
+            log_debug = self.log.isEnabledFor(logging.DEBUG)
             while self.is_move_running:
-                self.log.debug(f"Waiting for move done: {self.is_move_running}, {1e3*(time.perf_counter()-t_start)} ms")
+                if log_debug:
+                    self.log.debug(f"Waiting for move done: {self.is_move_running}, {1e3*(time.perf_counter()-t_start)} ms")
                 QGuiApplication.processEvents()
                 time.sleep(self._min_step_interval)
 
@@ -31,7 +31,6 @@ which can be obtained directly from
     https://www.thorlabs.com/software_pages/ViewSoftwarePage.cfm?Code=APT
 """
 
-from collections import OrderedDict
 
 from qudi.core.module import Base
 from qudi.util.paths import get_home_dir
@@ -879,7 +878,7 @@ class APTStage(MotorInterface):
             )
 
         # The references to the different axis are stored in this dictionary:
-        self._axis_dict = OrderedDict()
+        self._axis_dict = dict()
 
         hw_conf_dict = self._get_config()
 
@@ -976,7 +975,7 @@ class APTStage(MotorInterface):
             if 'constraints' in axisconfig:
                 constraintsconfig = axisconfig['constraints']
             else:
-                constraintsconfig = OrderedDict()
+                constraintsconfig = dict()
 
             # Now we can read through these axisconstraints
 
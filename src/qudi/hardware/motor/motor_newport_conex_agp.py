@@ -21,7 +21,6 @@ If not, see <https://www.gnu.org/licenses/>.
 """
 
 import serial
-from collections import OrderedDict
 
 from qudi.core.module import Base
 from qudi.core.configoption import ConfigOption
@@ -163,7 +162,7 @@ class MotorNewportConexAGP(MotorInterface):
         Each constraint is a tuple of the form
             (min_value, max_value, stepsize)
         """
-        constraints = OrderedDict()
+        constraints = dict()
 
         axis = {
             'label': self._axis_label,
@@ -26,7 +26,6 @@ except ImportError:
     import visa
 import time
 
-from collections import OrderedDict
 
 from qudi.core.module import Base
 from qudi.core.configoption import ConfigOption
@@ -216,7 +215,7 @@ class MotorStageMicos(MotorInterface):
         If you are not sure about the meaning, look in other hardware files
         to get an impression.
         """
-        constraints = OrderedDict()
+        constraints = dict()
 
         axis0 = {'label': self._first_axis_label,
                  'ID': self._first_axis_ID,
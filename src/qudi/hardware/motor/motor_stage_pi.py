@@ -26,7 +26,6 @@ except ImportError:
     import visa
 import time
 
-from collections import OrderedDict
 
 from qudi.core.module import Base
 from qudi.core.configoption import ConfigOption
@@ -157,7 +156,7 @@ class MotorStagePI(MotorInterface):
         Each constraint is a tuple of the form
             (min_value, max_value, stepsize)
         """
-        constraints = OrderedDict()
+        constraints = dict()
 
         axis0 = {'label': self._first_axis_label,
                  'ID': self._first_axis_ID,
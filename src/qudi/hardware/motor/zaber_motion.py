@@ -20,7 +20,6 @@ top-level directory of this distribution and at <https://github.com/Ulm-IQO/qudi
 """
 
 
-from collections import OrderedDict
 
 from qudi.interface.motor_interface import MotorInterface
 from qudi.core.configoption import ConfigOption, MissingOption
@@ -93,7 +92,7 @@ class ZaberStage(MotorInterface):
         # get and store device info from internet
         zlib.enable_device_db_store()
 
-        self._axis_dict = OrderedDict()
+        self._axis_dict = dict()
         self._device_list, self._connection = [], None
         hw_conf_dict = self.get_hardware_config_per_axis()
 
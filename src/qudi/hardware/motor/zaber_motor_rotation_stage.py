@@ -25,7 +25,6 @@ try:
     import pyvisa as visa
 except ImportError:
     import visa
-from collections import OrderedDict
 
 from qudi.core.module import Base
 from qudi.core.configoption import ConfigOption
@@ -119,7 +118,7 @@ class MotorRotationZaber(MotorInterface):
         Each constraint is a tuple of the form
             (min_value, max_value, stepsize)
         """
-        constraints = OrderedDict()
+        constraints = dict()
 
         rot = {'label': self._axis_label,
                'ID': None,
@@ -177,7 +177,7 @@ class PulseStreamer(PulserInterface):
         # the name a_ch<num> and d_ch<num> are generic names, which describe UNAMBIGUOUSLY the
         # channels. Here all possible channel configurations are stated, where only the generic
         # names should be used. The names for the different configurations can be customary chosen.
-        activation_conf = OrderedDict()
+        activation_conf = dict()
         activation_conf['yourconf'] = {'a_ch1', 'd_ch1', 'd_ch2', 'a_ch2', 'd_ch3', 'd_ch4'}
         activation_conf['different_conf'] = {'a_ch1', 'd_ch1', 'd_ch2'}
         activation_conf['something_else'] = {'a_ch2', 'd_ch3', 'd_ch4'}
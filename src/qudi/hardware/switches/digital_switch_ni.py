@@ -24,7 +24,7 @@ import time
 import re
 import nidaqmx
 from qudi.core.configoption import ConfigOption
-from qudi.util.mutex import RecursiveMutex
+from qudi.util.mutex import Mutex
 from qudi.interface.switch_interface import SwitchInterface
 from qudi.core.statusvariable import StatusVar
 
@@ -66,7 +66,7 @@ class DigitalSwitchNI(SwitchInterface):
         """ Create the digital switch output control module
         """
         super().__init__(*args, **kwargs)
-        self.lock = RecursiveMutex()
+        self.lock = Mutex()
 
         self._channels = tuple()
 
@@ -158,13 +158,7 @@ class DigitalSwitchNI(SwitchInterface):
 
         @param dict state_dict: state dict of the form {"switch": "state"}
         """
-        avail_states = self.available_states
-        assert isinstance(state_dict,
-                          dict), f'Property "state" must be dict type. Received: {type(state_dict)}'
-        assert all(switch in avail_states for switch in
-                   state_dict), f'Invalid switch name(s) encountered: {tuple(state_dict)}'
-        assert all(isinstance(state, str) for state in
-                   state_dict.values()), f'Invalid switch state(s) encountered: {tuple(state_dict.values())}'
+        avail_states = self._chk_state_dict(state_dict)
 
         if state_dict:
             with self.lock:
@@ -26,7 +26,7 @@ except ImportError:
     import visa
 from qudi.core.configoption import ConfigOption
 from qudi.core.statusvariable import StatusVar
-from qudi.util.mutex import RecursiveMutex
+from qudi.util.mutex import Mutex
 from qudi.interface.switch_interface import SwitchInterface
 
 
@@ -64,7 +64,7 @@ class FlipMirror(SwitchInterface):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.lock = RecursiveMutex()
+        self.lock = Mutex()
         self._resource_manager = None
         self._instrument = None
         self._switches = dict()
@@ -146,17 +146,12 @@ class FlipMirror(SwitchInterface):
 
         @param dict state_dict: state dict of the form {"switch": "state"}
         """
-        assert isinstance(state_dict, dict), \
-            f'Property "state" must be dict type. Received: {type(state_dict)}'
-        assert all(switch in self.available_states for switch in state_dict), \
-            f'Invalid switch name(s) encountered: {tuple(state_dict)}'
-        assert all(isinstance(state, str) for state in state_dict.values()), \
-            f'Invalid switch state(s) encountered: {tuple(state_dict.values())}'
+        avail_states = self._chk_state_dict(state_dict)
 
         if state_dict:
             with self.lock:
                 switch, state = next(iter(state_dict.items()))
-                down = self.available_states[switch][0] == state
+                down = avail_states[switch][0] == state
                 answer = self._instrument.query('SH1' if down else 'SV1', delay=self._switch_time)
                 assert answer == 'OK1', \
                     f'setting of state "{state}" in switch "{switch}" failed with return value "{answer}"'
@@ -188,12 +188,7 @@ class HardwareSwitchFpga(SwitchInterface):
 
         @param dict state_dict: state dict of the form {"switch": "state"}
         """
-        assert isinstance(state_dict, dict), \
-            f'Property "state" must be dict type. Received: {type(state_dict)}'
-        assert all(switch in self.available_states for switch in state_dict), \
-            f'Invalid switch name(s) encountered: {tuple(state_dict)}'
-        assert all(isinstance(state, str) for state in state_dict.values()), \
-            f'Invalid switch state(s) encountered: {tuple(state_dict.values())}'
+        avail_states = self._chk_state_dict(state_dict)
 
         with self._lock:
             # determine desired state of ALL switches
@@ -202,7 +197,7 @@ class HardwareSwitchFpga(SwitchInterface):
             # encode states into a single int
             new_channel_state = 0
             for channel_index, (switch, state) in enumerate(new_states.items()):
-                if state == self.available_states[switch][1]:
+                if state == avail_states[switch][1]:
                     new_channel_state |= 1 << channel_index
 
             # apply changes in hardware
@@ -114,6 +114,21 @@ class SwitchInterface(Base):
         for switch, state in state_dict.items():
             self.set_state(switch, state)
 
+    def _chk_state_dict(self, state_dict: Mapping[str, str]) -> Dict[str, Tuple[str, ...]]:
+        """ Check a state dict passed to the states setter in a single pass over its items.
+        Hardware modules overwriting the states setter can call this to validate their input.
+
+        @param dict state_dict: state dict of the form {"switch": "state"}
+        @return dict: the available states fetched for the check, for reuse by the caller
+        """
+        assert isinstance(state_dict, dict), \
+            f'Property "state" must be dict type. Received: {type(state_dict)}'
+        avail_states = self.available_states
+        for switch, state in state_dict.items():
+            assert switch in avail_states, f'Invalid switch name encountered: "{switch}"'
+            assert isinstance(state, str), f'Invalid switch state encountered: {state!r}'
+        return avail_states
+
     @staticmethod
     def _chk_refine_available_switches(switch_dict: Dict[str, Sequence[str]]
                                        ) -> Dict[str, Tuple[str, ...]]:
@@ -22,8 +22,6 @@ If not, see <https://www.gnu.org/licenses/>.
 
 import datetime
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib as mpl
 from PySide2 import QtCore
 from qudi.core.connector import Connector
 from qudi.core.configoption import ConfigOption
@@ -178,6 +176,8 @@ class CameraLogic(LogicBase):
         return f"{time_stamp}_captured_frame"
 
     def draw_2d_image(self, data, cbar_range=None):
+        import matplotlib.pyplot as plt
+
         # Create image plot
         fig, ax = plt.subplots()
         cfimage = ax.imshow(data,
@@ -23,9 +23,7 @@ You should have received a copy of the GNU Lesser General Public License along w
 If not, see <https://www.gnu.org/licenses/>.
 """
 
-from collections import OrderedDict
 import datetime
-import matplotlib.pyplot as plt
 import numpy as np
 import time
 
@@ -485,19 +483,19 @@ class LaserScannerLogic(LogicBase):
             filelabel2 = 'volt_data_raw_trace'
             filelabel3 = 'volt_data_raw_retrace'
 
-        # prepare the data in a dict or in an OrderedDict:
-        data = OrderedDict()
+        # prepare the data in a dict:
+        data = dict()
         data['frequency (Hz)'] = self.plot_x
         data['trace count data (counts/s)'] = self.plot_y
         data['retrace count data (counts/s)'] = self.plot_y2
 
-        data2 = OrderedDict()
+        data2 = dict()
         data2['count data (counts/s)'] = self.scan_matrix[:self._scan_counter_up, :]
 
-        data3 = OrderedDict()
+        data3 = dict()
         data3['count data (counts/s)'] = self.scan_matrix2[:self._scan_counter_down, :]
 
-        parameters = OrderedDict()
+        parameters = dict()
         parameters['Number of frequency sweeps (#)'] = self._scan_counter_up
         parameters['Start Voltage (V)'] = self.scan_range[0]
         parameters['Stop Voltage (V)'] = self.scan_range[1]
@@ -606,6 +604,8 @@ class LaserScannerLogic(LogicBase):
 
         cbar_prefix = prefix[prefix_index]
 
+        import matplotlib.pyplot as plt
+
         # Use qudi style
         plt.style.use(self._save_logic.mpl_qd_style)
 
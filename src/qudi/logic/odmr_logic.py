@@ -23,7 +23,6 @@ If not, see <https://www.gnu.org/licenses/>.
 import numpy as np
 import time
 import datetime
-import matplotlib.pyplot as plt
 from PySide2 import QtCore
 
 from qudi.util.datafitting import FitContainer, FitConfigurationsModel
@@ -832,6 +831,8 @@ class OdmrLogic(LogicBase):
         if raw_unit_prefix:
             raw_data = raw_data / scaled.scale_val
 
+        import matplotlib.pyplot as plt
+
         # Create figure
         fig, (ax_signal, ax_raw) = plt.subplots(nrows=2, ncols=1)
 
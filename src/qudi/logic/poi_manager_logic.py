@@ -31,9 +31,7 @@ from typing import Dict
 import numpy as np
 import time
 from datetime import datetime
-from collections import OrderedDict
 from PySide2 import QtCore
-from matplotlib import pyplot as plt, patches
 from matplotlib.figure import Figure
 
 from qudi.core.module import LogicBase
@@ -1142,7 +1140,7 @@ class PoiManagerLogic(LogicBase):
                 timestamp.strftime('%Y%m%d-%H%M-%S'), roi_name_no_blanks)
 
             # Metadata to save in both file headers
-            parameters = OrderedDict()
+            parameters = dict()
             if self.active_poi:
                 parameters['Active POI'] = self.active_poi
             parameters['roi_name'] = self.roi_name
@@ -1192,10 +1190,12 @@ class PoiManagerLogic(LogicBase):
 
         # add POIs
         si_factors = scan_image.si_factors
-        self.add_pois(plt.gca(), scan_image.ranges[1], si_factors[0].scale_val, si_factors[1].scale_val)
+        self.add_pois(fig.gca(), scan_image.ranges[1], si_factors[0].scale_val, si_factors[1].scale_val)
         return fig
 
     def add_pois(self, ax, scan_range_y, si_factor_x, si_factor_y):
+        from matplotlib import patches
+
         radius = abs(scan_range_y[1] - scan_range_y[0]) / si_factor_y * 0.025  # 2.5% of the y-range
         marker_color = '#F0F'
         for name, pos in self.poi_positions.items():
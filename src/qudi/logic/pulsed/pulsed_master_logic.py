@@ -95,6 +95,9 @@ class PulsedMasterLogic(LogicBase):
     sigDeletePulseBlock = QtCore.Signal(str)
     sigDeleteBlockEnsemble = QtCore.Signal(str)
     sigDeleteSequence = QtCore.Signal(str)
+    sigDeletePulseBlocks = QtCore.Signal(tuple)
+    sigDeleteBlockEnsembles = QtCore.Signal(tuple)
+    sigDeleteSequences = QtCore.Signal(tuple)
     sigLoadBlockEnsemble = QtCore.Signal(str)
     sigLoadSequence = QtCore.Signal(str)
     sigSampleBlockEnsemble = QtCore.Signal(str)
@@ -206,6 +209,12 @@ class PulsedMasterLogic(LogicBase):
             self.sequencegeneratorlogic().delete_ensemble, QtCore.Qt.QueuedConnection)
         self.sigDeleteSequence.connect(
             self.sequencegeneratorlogic().delete_sequence, QtCore.Qt.QueuedConnection)
+        self.sigDeletePulseBlocks.connect(
+            self.sequencegeneratorlogic().delete_blocks, QtCore.Qt.QueuedConnection)
+        self.sigDeleteBlockEnsembles.connect(
+            self.sequencegeneratorlogic().delete_ensembles, QtCore.Qt.QueuedConnection)
+        self.sigDeleteSequences.connect(
+            self.sequencegeneratorlogic().delete_sequences, QtCore.Qt.QueuedConnection)
         self.sigLoadBlockEnsemble.connect(
             self.sequencegeneratorlogic().load_ensemble, QtCore.Qt.QueuedConnection)
         self.sigLoadSequence.connect(
@@ -291,6 +300,9 @@ class PulsedMasterLogic(LogicBase):
         self.sigDeletePulseBlock.disconnect()
         self.sigDeleteBlockEnsemble.disconnect()
         self.sigDeleteSequence.disconnect()
+        self.sigDeletePulseBlocks.disconnect()
+        self.sigDeleteBlockEnsembles.disconnect()
+        self.sigDeleteSequences.disconnect()
         self.sigLoadBlockEnsemble.disconnect()
         self.sigLoadSequence.disconnect()
         self.sigSampleBlockEnsemble.disconnect()
@@ -875,9 +887,7 @@ class PulsedMasterLogic(LogicBase):
         """
         Helper method to delete all pulse blocks at once.
         """
-        to_delete = tuple(self.saved_pulse_blocks)
-        for block_name in to_delete:
-            self.sigDeletePulseBlock.emit(block_name)
+        self.sigDeletePulseBlocks.emit(tuple(self.saved_pulse_blocks))
         return
 
     @QtCore.Slot(str)
@@ -904,9 +914,7 @@ class PulsedMasterLogic(LogicBase):
             self.log.error('Can not delete all PulseBlockEnsembles. Pulse generator is currently '
                            'running or measurement is in progress.')
         else:
-            to_delete = tuple(self.saved_pulse_block_ensembles)
-            for ensemble_name in to_delete:
-                self.sigDeleteBlockEnsemble.emit(ensemble_name)
+            self.sigDeleteBlockEnsembles.emit(tuple(self.saved_pulse_block_ensembles))
         return
 
     @QtCore.Slot(str)
@@ -932,9 +940,7 @@ class PulsedMasterLogic(LogicBase):
             self.log.error('Can not delete all PulseSequences. Pulse generator is currently '
                            'running or measurement is in progress.')
         else:
-            to_delete = tuple(self.saved_pulse_sequences)
-            for sequence_name in to_delete:
-                self.sigDeleteSequence.emit(sequence_name)
+            self.sigDeleteSequences.emit(tuple(self.saved_pulse_sequences))
         return
 
     @QtCore.Slot()
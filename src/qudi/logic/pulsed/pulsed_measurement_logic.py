@@ -24,7 +24,6 @@ from PySide2 import QtCore
 import numpy as np
 import time
 import datetime
-import matplotlib.pyplot as plt
 
 from qudi.core.connector import Connector
 from qudi.core.configoption import ConfigOption
@@ -130,6 +129,11 @@ class PulsedMeasurementLogic(LogicBase):
     window = StatusVar(default='none')
     base_corr = StatusVar(default=True)
 
+    # analysis settings given in time that need to be aligned to the fast counter bin width
+    __bin_aligned_analysis_settings = frozenset(
+        ('signal_start', 'signal_end', 'norm_start', 'norm_end')
+    )
+
     # notification signals for master module (i.e. GUI)
     sigMeasurementDataUpdated = QtCore.Signal()
     sigTimerUpdated = QtCore.Signal(float, int, float)
@@ -770,10 +774,10 @@ class PulsedMeasurementLogic(LogicBase):
         else:
             settings_dict.update(kwargs)
 
-        for key in settings_dict:
-            if key in ['signal_start', 'signal_end', 'norm_start', 'norm_end']:
-                num_bins_fast = round(settings_dict[key]/self.fast_counter_settings['bin_width'])
-                settings_dict[key] = num_bins_fast * self.fast_counter_settings['bin_width']
+        bin_width = float(self.__fast_counter_binwidth)
+        for key in self.__bin_aligned_analysis_settings.intersection(settings_dict):
+            num_bins_fast = round(settings_dict[key] / bin_width)
+            settings_dict[key] = num_bins_fast * bin_width
 
         # Use threadlock to update settings during a running measurement
         with self._threadlock:
@@ -1618,6 +1622,8 @@ class PulsedMeasurementLogic(LogicBase):
 
             return text_str
 
+        import matplotlib.pyplot as plt
+
         # Prepare the figure to save as a "data thumbnail"
         plt.style.use(QudiMatplotlibStyle.style)
 
@@ -27,7 +27,6 @@ import time
 import copy
 import traceback
 import datetime
-import re
 
 from PySide2 import QtCore
 from qudi.core.statusvariable import StatusVar
@@ -163,8 +162,7 @@ class SequenceGeneratorLogic(LogicBase):
     def on_activate(self):
         """ Initialisation performed during activation of the module.
         """
-        if not os.path.exists(self._assets_storage_dir):
-            os.makedirs(self._assets_storage_dir)
+        os.makedirs(self._assets_storage_dir, exist_ok=True)
 
         # additional import paths for generator modules
         self._predefined_path_list = list()
@@ -504,7 +502,7 @@ class SequenceGeneratorLogic(LogicBase):
         # Check if the PulseBlockEnsemble has been sampled already.
         if ensemble.sampling_information:
             # Check if the corresponding waveforms are present in the pulse generator memory
-            ready_waveforms = self.sampled_waveforms
+            ready_waveforms = set(self.sampled_waveforms)
             for waveform in ensemble.sampling_information['waveforms']:
                 if waveform not in ready_waveforms:
                     self.log.error('Waveform "{0}" associated with PulseBlockEnsemble "{1}" not '
@@ -556,7 +554,7 @@ class SequenceGeneratorLogic(LogicBase):
         # Check if the PulseSequence has been sampled already.
         if sequence.sampling_information and sequence.name in self.sampled_sequences:
             # Check if the corresponding waveforms are present in the pulse generator memory
-            ready_waveforms = self.sampled_waveforms
+            ready_waveforms = set(self.sampled_waveforms)
             for waveform in sequence.sampling_information['waveforms']:
                 if waveform not in ready_waveforms:
                     self.log.error('Waveform "{0}" associated with PulseSequence "{1}" not '
@@ -760,14 +758,23 @@ class SequenceGeneratorLogic(LogicBase):
 
         @param name: string, name of the PulseBlock object to be removed.
         """
-        # Delete from dict
-        if name in self.saved_pulse_blocks:
-            del (self._saved_pulse_blocks[name])
+        self.delete_blocks((name,))
+        return
 
-        # Delete from disk
-        filepath = os.path.join(self._assets_storage_dir, '{0}.block'.format(name))
-        if os.path.exists(filepath):
-            os.remove(filepath)
+    def delete_blocks(self, names):
+        """ Remove several serialized PulseBlock objects from the block list and HDD.
+        The updated block dict is only emitted once after all blocks have been removed.
+
+        @param names: iterable of strings, names of the PulseBlock objects to be removed.
+        """
+        for name in names:
+            # Delete from dict
+            self._saved_pulse_blocks.pop(name, None)
+
+            # Delete from disk
+            filepath = os.path.join(self._assets_storage_dir, '{0}.block'.format(name))
+            if os.path.exists(filepath):
+                os.remove(filepath)
 
         self.sigBlockDictUpdated.emit(self.saved_pulse_blocks)
         return
@@ -861,21 +868,30 @@ class SequenceGeneratorLogic(LogicBase):
         Remove the ensemble with 'name' from the ensemble dict and all associated waveforms
         from the pulser memory.
         """
-        # Delete from dict
-        if name in self.saved_pulse_block_ensembles:
+        self.delete_ensembles((name,))
+        return
+
+    def delete_ensembles(self, names):
+        """
+        Remove several ensembles from the ensemble dict and all associated waveforms from the
+        pulser memory. Update signals are only emitted once after all ensembles have been removed.
+        """
+        waveforms_deleted = False
+        for name in names:
+            # Delete from dict
+            ensemble = self._saved_pulse_block_ensembles.pop(name, None)
             # check if ensemble has already been sampled and delete associated waveforms
-            if self.saved_pulse_block_ensembles[name].sampling_information:
-                self._delete_waveform(
-                    self.saved_pulse_block_ensembles[name].sampling_information['waveforms'])
-                self.sigAvailableWaveformsUpdated.emit(self.sampled_waveforms)
-            # delete PulseBlockEnsemble
-            del self._saved_pulse_block_ensembles[name]
-
-        # Delete from disk
-        filepath = os.path.join(self._assets_storage_dir, '{0}.ensemble'.format(name))
-        if os.path.exists(filepath):
-            os.remove(filepath)
+            if ensemble is not None and ensemble.sampling_information:
+                self._delete_waveform(ensemble.sampling_information['waveforms'])
+                waveforms_deleted = True
+
+            # Delete from disk
+            filepath = os.path.join(self._assets_storage_dir, '{0}.ensemble'.format(name))
+            if os.path.exists(filepath):
+                os.remove(filepath)
 
+        if waveforms_deleted:
+            self.sigAvailableWaveformsUpdated.emit(self.sampled_waveforms)
         self.sigEnsembleDictUpdated.emit(self.saved_pulse_block_ensembles)
         return
 
@@ -976,23 +992,33 @@ class SequenceGeneratorLogic(LogicBase):
         Remove the sequence with 'name' from the sequence dict and all associated waveforms
         from the pulser memory.
         """
-        if name in self.saved_pulse_sequences:
-            # check if sequence has already been sampled and delete associated sequence from pulser.
-            # Also delete associated waveforms if sequence has been sampled within rotating frame.
-            if self.saved_pulse_sequences[name].sampling_information:
+        self.delete_sequences((name,))
+        return
+
+    def delete_sequences(self, names):
+        """
+        Remove several sequences from the sequence dict and all associated waveforms from the
+        pulser memory. Update signals are only emitted once after all sequences have been removed.
+        """
+        waveforms_deleted = False
+        for name in names:
+            sequence = self._saved_pulse_sequences.pop(name, None)
+            # check if sequence has already been sampled and delete associated sequence from
+            # pulser. Also delete associated waveforms if sequence has been sampled within
+            # rotating frame.
+            if sequence is not None and sequence.sampling_information:
                 self._delete_sequence(name)
-                if self.saved_pulse_sequences[name].rotating_frame:
-                    self._delete_waveform(
-                        self.saved_pulse_sequences[name].sampling_information['waveforms'])
-                    self.sigAvailableWaveformsUpdated.emit(self.sampled_waveforms)
-            # delete PulseSequence
-            del self._saved_pulse_sequences[name]
-
-        # Delete from disk
-        filepath = os.path.join(self._assets_storage_dir, '{0}.sequence'.format(name))
-        if os.path.exists(filepath):
-            os.remove(filepath)
+                if sequence.rotating_frame:
+                    self._delete_waveform(sequence.sampling_information['waveforms'])
+                    waveforms_deleted = True
+
+            # Delete from disk
+            filepath = os.path.join(self._assets_storage_dir, '{0}.sequence'.format(name))
+            if os.path.exists(filepath):
+                os.remove(filepath)
 
+        if waveforms_deleted:
+            self.sigAvailableWaveformsUpdated.emit(self.sampled_waveforms)
         self.sigSequenceDictUpdated.emit(self.saved_pulse_sequences)
         return
 
@@ -2103,7 +2129,7 @@ class SequenceGeneratorLogic(LogicBase):
     def _delete_waveform(self, names):
         if isinstance(names, str):
             names = [names]
-        current_waveforms = self.sampled_waveforms
+        current_waveforms = set(self.sampled_waveforms)
         for wfm in names:
             if wfm in current_waveforms:
                 self.pulsegenerator().delete_waveform(wfm)
@@ -2127,7 +2153,7 @@ class SequenceGeneratorLogic(LogicBase):
     def _delete_sequence(self, names):
         if isinstance(names, str):
             names = [names]
-        current_sequences = self.sampled_sequences
+        current_sequences = set(self.sampled_sequences)
         for seq in names:
             if seq in current_sequences:
                 self.pulsegenerator().delete_sequence(seq)
@@ -2140,8 +2166,9 @@ class SequenceGeneratorLogic(LogicBase):
         :param wave_name: with (rabi_ch1) or without (rabi) channel extension.
         :return: stripped name (rabi)
         """
-        if re.match(r'.*_ch[0-9]+?$', wave_name, re.IGNORECASE) is not None:
-            return wave_name.rsplit('_', 1)[0]
+        stripped_name, separator, extension = wave_name.rpartition('_')
+        if separator and extension[:2].lower() == 'ch' and extension[2:].isdecimal():
+            return stripped_name
         return wave_name
 
     @QtCore.Slot()
@@ -28,8 +28,6 @@ from functools import reduce
 import operator
 from typing import List, Optional, Tuple, Dict, Set
 
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 from PySide2 import QtCore
 
 from qudi.core.module import LogicBase
@@ -93,7 +91,9 @@ class ScanningDataLogic(LogicBase):
         else:
             self._curr_history_index = 0
         self._logic_id = self._scan_logic().module_uuid
-        self._scan_logic().sigNewScanDataForHistory.connect(self._append_to_history)
+        self._scan_logic().sigNewScanDataForHistory.connect(
+            self._append_to_history, QtCore.Qt.QueuedConnection
+        )
 
     def on_deactivate(self):
         """ Reverse steps of activation
@@ -238,6 +238,9 @@ class ScanningDataLogic(LogicBase):
         si_prefix_data = ScaledFloat(np.nanmax(data)-np.nanmin(data)).scale
         si_factor_data = ScaledFloat(np.nanmax(data)-np.nanmin(data)).scale_val
 
+        import matplotlib.pyplot as plt
+        from matplotlib import transforms
+
         # Create figure
         fig, ax = plt.subplots()
 
@@ -274,7 +277,7 @@ class ScanningDataLogic(LogicBase):
         # draw the scanner position if defined
         pos_x = scanner_pos[axis]
         if pos_x > np.min(x_axis) and pos_x < np.max(x_axis):
-            trans_xmark = mpl.transforms.blended_transform_factory(ax.transData, ax.transAxes)
+            trans_xmark = transforms.blended_transform_factory(ax.transData, ax.transAxes)
             ax.annotate('',
                         xy=np.asarray([pos_x, 0])/si_factor_x,
                         xytext=(pos_x/si_factor_x, -0.01),
@@ -346,7 +349,7 @@ class ScanningDataLogic(LogicBase):
                     elif len(scan_data.settings.axes) == 2:
                         scan_image = ScanImage.from_scan_data(scan_data, channel)
                         figure = self.draw_2d_scan_figure(scan_image, cbar_range=color_range)
-                        ax = plt.gca()
+                        ax = figure.gca()
                         self._add_draw_scanner_pos(ax, scan_data)
                         ds.save_thumbnail(figure, file_path=file_path.rsplit('.', 1)[0])
                     else:
@@ -399,6 +402,8 @@ class ScanningDataLogic(LogicBase):
         if cbar_range is None:
             cbar_range = (np.nanmin(image_arr), np.nanmax(image_arr))
 
+        import matplotlib.pyplot as plt
+
         # Create figure
         fig, ax = plt.subplots()
 
@@ -460,8 +465,10 @@ class ScanningDataLogic(LogicBase):
         # draw the scanner position if defined and in range
         if np.min(scan_range_x) < pos_x < np.max(scan_range_x) \
                 and np.min(scan_range_y) < pos_y < np.max(scan_range_y):
-            trans_xmark = mpl.transforms.blended_transform_factory(ax.transData, ax.transAxes)
-            trans_ymark = mpl.transforms.blended_transform_factory(ax.transAxes, ax.transData)
+            from matplotlib import transforms
+
+            trans_xmark = transforms.blended_transform_factory(ax.transData, ax.transAxes)
+            trans_ymark = transforms.blended_transform_factory(ax.transAxes, ax.transData)
             ax.annotate('',
                         xy=np.asarray([pos_x, 0])/si_factor_x,
                         xytext=(pos_x/si_factor_x, -0.01),
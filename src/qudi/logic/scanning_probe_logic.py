@@ -23,7 +23,6 @@ from itertools import combinations
 from typing import Tuple, Sequence, Dict, Optional
 from uuid import UUID
 import copy as cp
-from collections import OrderedDict
 
 from PySide2 import QtCore
 import numpy as np
@@ -121,7 +120,7 @@ class ScanningProbeLogic(LogicBase):
         self.__scan_poll_timer.setSingleShot(True)
         self.__scan_poll_timer.timeout.connect(self.__scan_poll_loop, QtCore.Qt.QueuedConnection)
 
-        self._scan_axes = OrderedDict(sorted(self._scanner().constraints.axes.items()))
+        self._scan_axes = dict(sorted(self._scanner().constraints.axes.items()))
 
     def on_deactivate(self):
         """ Reverse steps of activation
@@ -167,38 +166,36 @@ class ScanningProbeLogic(LogicBase):
     def back_scan_capability(self) -> BackScanCapability:
         return self.scanner_constraints.back_scan_capability
 
+    # The scan settings dicts are never mutated in place. Setters validate an updated copy first and
+    # only then replace the dict, so the read-only properties below never see a rejected value and
+    # can access them without acquiring the thread lock.
+
     @property
     def scan_ranges(self) -> Dict[str, Tuple[float, float]]:
-        with self._thread_lock:
-            return self._scan_ranges.copy()
+        return self._scan_ranges.copy()
 
     @property
     def scan_resolution(self) -> Dict[str, int]:
-        with self._thread_lock:
-            return self._scan_resolution.copy()
+        return self._scan_resolution.copy()
 
     @property
     def back_scan_resolution(self) -> Dict[str, int]:
         """Resolution for the backwards scan of the fast axis."""
-        with self._thread_lock:
-            # use value of forward scan if not configured otherwise (merge dictionaries)
-            return {**self._scan_resolution, **self._back_scan_resolution}
+        # use value of forward scan if not configured otherwise (merge dictionaries)
+        return {**self._scan_resolution, **self._back_scan_resolution}
 
     @property
     def scan_frequency(self) -> Dict[str, float]:
-        with self._thread_lock:
-            return self._scan_frequency.copy()
+        return self._scan_frequency.copy()
 
     @property
     def back_scan_frequency(self) -> Dict[str, float]:
-        with self._thread_lock:
-            # use value of forward scan if not configured otherwise (merge dictionaries)
-            return {**self._scan_frequency, **self._back_scan_frequency}
+        # use value of forward scan if not configured otherwise (merge dictionaries)
+        return {**self._scan_frequency, **self._back_scan_frequency}
 
     @property
     def use_back_scan_settings(self) -> bool:
-        with self._thread_lock:
-            return self._use_back_scan_settings
+        return self._use_back_scan_settings
 
     def set_use_back_scan_settings(self, use: bool) -> None:
         with self._thread_lock:
@@ -207,8 +204,7 @@ class ScanningProbeLogic(LogicBase):
     @property
     def save_to_history(self) -> bool:
         """Whether to save finished scans to history."""
-        with self._thread_lock:
-            return self._save_to_hist
+        return self._save_to_hist
 
     @save_to_history.setter
     def save_to_history(self, save: bool) -> None:
@@ -218,29 +214,58 @@ class ScanningProbeLogic(LogicBase):
     def create_scan_settings(self, scan_axes: Sequence[str]) -> ScanSettings:
         """Create a ScanSettings object for a selected 1D or 2D scan."""
         with self._thread_lock:
-            return ScanSettings(
-                channels=tuple(self.scanner_channels),
-                axes=tuple(scan_axes),
-                range=tuple(tuple(self._scan_ranges[ax]) for ax in scan_axes),
-                resolution=tuple(self._scan_resolution[ax] for ax in scan_axes),
-                frequency=self._scan_frequency[scan_axes[0]],
-            )
+            return self._create_scan_settings(scan_axes,
+                                              self._scan_ranges,
+                                              self._scan_resolution,
+                                              self._scan_frequency)
 
     def create_back_scan_settings(self, scan_axes: Sequence[str]) -> ScanSettings:
         """Create a ScanSettings object for the backwards direction of a selected 1D or 2D scan."""
         with self._thread_lock:
-            # only use backwards scan resolution for the fast axis
-            resolution = [self.back_scan_resolution[scan_axes[0]]]
-            if len(scan_axes) > 1:
-                # slow axis resolution always matches the forward scan
-                resolution += [self.scan_resolution[ax] for ax in scan_axes[1:]]
-            return ScanSettings(
-                channels=tuple(self.scanner_channels),
-                axes=tuple(scan_axes),
-                range=tuple(tuple(self._scan_ranges[ax]) for ax in scan_axes),
-                resolution=tuple(resolution),
-                frequency=self.back_scan_frequency[scan_axes[0]],
-            )
+            return self._create_back_scan_settings(scan_axes,
+                                                   self._scan_ranges,
+                                                   self._scan_resolution,
+                                                   self._back_scan_resolution,
+                                                   self._scan_frequency,
+                                                   self._back_scan_frequency)
+
+    def _create_scan_settings(self,
+                              scan_axes: Sequence[str],
+                              ranges: Dict[str, Tuple[float, float]],
+                              resolution: Dict[str, int],
+                              frequency: Dict[str, float]) -> ScanSettings:
+        """Create a ScanSettings object from the given settings dicts. Used by the setters to
+        validate candidate settings before they are published."""
+        return ScanSettings(
+            channels=tuple(self.scanner_channels),
+            axes=tuple(scan_axes),
+            range=tuple(tuple(ranges[ax]) for ax in scan_axes),
+            resolution=tuple(resolution[ax] for ax in scan_axes),
+            frequency=frequency[scan_axes[0]],
+        )
+
+    def _create_back_scan_settings(self,
+                                   scan_axes: Sequence[str],
+                                   ranges: Dict[str, Tuple[float, float]],
+                                   resolution: Dict[str, int],
+                                   back_resolution: Dict[str, int],
+                                   frequency: Dict[str, float],
+                                   back_frequency: Dict[str, float]) -> ScanSettings:
+        """Create a backwards ScanSettings object from the given settings dicts. Backwards values
+        not configured fall back to the forward ones."""
+        # only use backwards scan resolution for the fast axis
+        fast_axis = scan_axes[0]
+        back_scan_resolution = [back_resolution.get(fast_axis, resolution[fast_axis])]
+        if len(scan_axes) > 1:
+            # slow axis resolution always matches the forward scan
+            back_scan_resolution += [resolution[ax] for ax in scan_axes[1:]]
+        return ScanSettings(
+            channels=tuple(self.scanner_channels),
+            axes=tuple(scan_axes),
+            range=tuple(tuple(ranges[ax]) for ax in scan_axes),
+            resolution=tuple(back_scan_resolution),
+            frequency=back_frequency.get(fast_axis, frequency[fast_axis]),
+        )
 
     def check_scan_settings(self):
         """Validate current scan settings for all possible 1D and 2D scans."""
@@ -256,30 +281,34 @@ class ScanningProbeLogic(LogicBase):
             if self.module_state() != 'idle':
                 self.log.warning('Scan is running. Unable to change scan ranges.')
             else:
-                old_scan_ranges = self.scan_ranges
-                self._scan_ranges[axis] = rng
+                scan_ranges = {**self._scan_ranges, axis: rng}
                 try:
                     # check only the axis with the change
-                    settings = self.create_scan_settings([axis])
+                    settings = self._create_scan_settings(
+                        [axis], scan_ranges, self._scan_resolution, self._scan_frequency
+                    )
                     self.scanner_constraints.check_settings(settings)
                 except Exception as e:
                     self.log.error("Invalid scan range or axis name.", exc_info=e)
-                    self._scan_ranges = old_scan_ranges
+                else:
+                    self._scan_ranges = scan_ranges
 
     def set_scan_resolution(self, axis: str, resolution: int) -> None:
         with self._thread_lock:
             if self.module_state() != 'idle':
                 self.log.warning('Scan is running. Unable to change scan resolution.')
             else:
-                old_scan_resolution = self.scan_resolution
-                self._scan_resolution[axis] = resolution
+                scan_resolution = {**self._scan_resolution, axis: resolution}
                 try:
                     # check only the axis with the change
-                    settings = self.create_scan_settings([axis])
+                    settings = self._create_scan_settings(
+                        [axis], self._scan_ranges, scan_resolution, self._scan_frequency
+                    )
                     self.scanner_constraints.check_settings(settings)
                 except Exception as e:
                     self.log.error("Invalid scan resolution or axis name.", exc_info=e)
-                    self._scan_resolution = old_scan_resolution
+                else:
+                    self._scan_resolution = scan_resolution
 
     def set_back_scan_resolution(self, axis: str, resolution: int) -> None:
         with self._thread_lock:
@@ -290,31 +319,36 @@ class ScanningProbeLogic(LogicBase):
                 if resolution != self.scan_resolution[axis] and resolution != 0:
                     self.log.error('Backward scan resolution must be the same as forward resolution for this scanner.')
             else:
-                old_back_scan_resolution = self.back_scan_resolution
-                self._back_scan_resolution[axis] = resolution
+                back_scan_resolution = {**self._back_scan_resolution, axis: resolution}
                 try:
                     # check only the axis with the change
                     forward_settings = self.create_scan_settings([axis])
-                    back_settings = self.create_back_scan_settings([axis])
+                    back_settings = self._create_back_scan_settings(
+                        [axis], self._scan_ranges, self._scan_resolution, back_scan_resolution,
+                        self._scan_frequency, self._back_scan_frequency
+                    )
                     self.scanner_constraints.check_back_scan_settings(back_settings, forward_settings)
                 except Exception as e:
                     self.log.error("Invalid back scan resolution setting.", exc_info=e)
-                    self._back_scan_resolution = old_back_scan_resolution
+                else:
+                    self._back_scan_resolution = back_scan_resolution
 
     def set_scan_frequency(self, axis: str, frequency: float) -> None:
         with self._thread_lock:
             if self.module_state() != 'idle':
                 self.log.warning('Scan is running. Unable to change scan frequency.')
             else:
-                old_scan_frequency = self.scan_frequency
-                self._scan_frequency[axis] = frequency
+                scan_frequency = {**self._scan_frequency, axis: frequency}
                 try:
                     # check only the axis with the change
-                    settings = self.create_scan_settings([axis])
+                    settings = self._create_scan_settings(
+                        [axis], self._scan_ranges, self._scan_resolution, scan_frequency
+                    )
                     self.scanner_constraints.check_settings(settings)
                 except Exception as e:
                     self.log.error("Invalid scan frequency or axis name.", exc_info=e)
-                    self._scan_frequency = old_scan_frequency
+                else:
+                    self._scan_frequency = scan_frequency
 
     def set_back_scan_frequency(self, axis: str, frequency: float) -> None:
         with self._thread_lock:
@@ -325,16 +359,19 @@ class ScanningProbeLogic(LogicBase):
                 if frequency != self.scan_frequency[axis] and frequency != 0.0:
                     self.log.error('Backward scan frequency must be the same as forward frequency for this scanner.')
             else:
-                old_back_scan_frequency = self.back_scan_frequency
-                self._back_scan_frequency[axis] = frequency
+                back_scan_frequency = {**self._back_scan_frequency, axis: frequency}
                 try:
                     # check only the axis with the change
                     forward_settings = self.create_scan_settings([axis])
-                    back_settings = self.create_back_scan_settings([axis])
+                    back_settings = self._create_back_scan_settings(
+                        [axis], self._scan_ranges, self._scan_resolution, self._back_scan_resolution,
+                        self._scan_frequency, back_scan_frequency
+                    )
                     self.scanner_constraints.check_back_scan_settings(back_settings, forward_settings)
                 except Exception as e:
                     self.log.error("Invalid back scan frequency setting.", exc_info=e)
-                    self._back_scan_frequency = old_back_scan_frequency
+                else:
+                    self._back_scan_frequency = back_scan_frequency
 
     def set_target_position(self, pos_dict, caller_id=None, move_blocking=False):
         with self._thread_lock:
@@ -624,7 +661,7 @@ class ScanningProbeLogic(LogicBase):
         """
 
         coord_reduced = {key:val for key, val in list(coord.items())[:3] if key in self._tilt_corr_axes}
-        coord_reduced = OrderedDict(sorted(coord_reduced.items()))
+        coord_reduced = dict(sorted(coord_reduced.items()))
 
         # convert from coordinate dict to plain vector
         transform = self._tilt_corr_transform.__call__
@@ -21,7 +21,6 @@ If not, see <https://www.gnu.org/licenses/>.
 
 from PySide2 import QtCore
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime
 import traceback
 
@@ -370,6 +369,8 @@ class SpectrometerLogic(LogicBase):
                                        timestamp=timestamp,
                                        column_dtypes=[float] * len(header))
 
+        import matplotlib.pyplot as plt
+
         # save the figure into a file
         figure, ax1 = plt.subplots()
         rescale_factor, prefix = self._get_si_scaling(np.max(data[1]))